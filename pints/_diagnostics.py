@@ -8,14 +8,28 @@
 import numpy as np
 
 
-def autocorrelation(x):
+def autocorrelation(x, mean=None):
     """
     Calculate autocorrelation for a vector x using a spectrum density
     calculation.
+
+    The autocovariance is obtained from the inverse Fourier transform of the
+    power spectrum (Wiener-Khinchin theorem), so that all lags are computed in
+    ``O(n log n)`` operations. If ``x`` is a 2d array, the autocorrelation of
+    each column is calculated.
+
+    If the (column) mean of ``x`` is already known it can be passed in as
+    ``mean`` to avoid recalculating it.
     """
-    x = (x - np.mean(x)) / (np.std(x) * np.sqrt(len(x)))
-    result = np.correlate(x, x, mode='full')
-    return result[int(result.size / 2):]
+    x = np.asarray(x, dtype=float)
+    n = x.shape[0]
+    x = x - (np.mean(x, axis=0) if mean is None else mean)
+
+    # Zero-pad to avoid circular wrap-around, rounding up to a power of two
+    n_fft = 2 ** int(np.ceil(np.log2(2 * n - 1)))
+    f = np.fft.rfft(x, n=n_fft, axis=0)
+    acov = np.fft.irfft(f.real**2 + f.imag**2, n=n_fft, axis=0)[:n]
+    return acov / acov[0]
 
 
 def autocorrelate_negative(autocorrelation):
@@ -41,9 +55,12 @@ def ess_single_param(x):
     return ess
 
 
-def effective_sample_size(samples):
+def effective_sample_size(samples, mean=None):
     """
     Calculates ESS for a matrix of samples.
+
+    If the mean of each parameter (column) in ``samples`` has already been
+    calculated it can be passed in as ``mean`` to avoid recalculating it.
     """
     try:
         n_samples, n_params = samples.shape
@@ -52,7 +69,13 @@ def effective_sample_size(samples):
     if n_samples < 2:
         raise ValueError('At least two samples must be given.')
 
-    return [ess_single_param(samples[:, i]) for i in range(0, n_params)]
+    # Calculate autocorrelations for all parameters at once
+    rho = autocorrelation(samples, mean)
+    ess = []
+    for i in range(n_params):
+        T = autocorrelate_negative(rho[:, i])
+        ess.append(n_samples / (1 + 2 * np.sum(rho[0:T, i])))
+    return ess
 
 
 def _within(chains):
@@ -120,7 +143,7 @@ def _between(chains):
     return b
 
 
-def rhat(chains, warm_up=0.0):
+def rhat(chains, warm_up=0.0, means=None, variances=None):
     r"""
     Returns the convergence measure :math:`\hat{R}` for the approximate
     posterior according to [1]_.
@@ -183,6 +206,13 @@ def rhat(chains, warm_up=0.0):
     warm_up : float
         First portion of each chain that will not be used for the
         computation of :math:`\hat{R}`.
+    means : np.ndarray of shape (2m, ) or (2m, p)
+        Optional means :math:`\bar{\psi} _j` of the :math:`m'=2m` split
+        chains (after warm-up). If given together with ``variances``, these
+        are used instead of recalculating them from ``chains``.
+    variances : np.ndarray of shape (2m, ) or (2m, p)
+        Optional unbiased variances :math:`s_j^2` of the :math:`m'=2m` split
+        chains (after warm-up), to be used together with ``means``.
 
     Returns
     -------
@@ -213,13 +243,18 @@ def rhat(chains, warm_up=0.0):
         raise ValueError(
             'Number of samples per chain after warm-up and chain splitting is '
             '%d. Method needs at least 1 sample per chain.' % n)
-    chains = np.vstack([chains[:, :n], chains[:, -n:]])
-
-    # Compute mean within-chain variance
-    w = _within(chains)
-
-    # Compute mean between-chain variance
-    b = _between(chains)
+    if means is None or variances is None:
+        chains = np.vstack([chains[:, :n], chains[:, -n:]])
+
+        # Compute mean within-chain variance
+        w = _within(chains)
+
+        # Compute mean between-chain variance
+        b = _between(chains)
+    else:
+        # Use precomputed split-chain moments
+        w = np.mean(variances, axis=0)
+        b = n * np.var(means, axis=0, ddof=1)
 
     # Compute Rhat
     rhat = np.sqrt((n - 1.0) / n + b / (w * n))
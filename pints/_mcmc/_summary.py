@@ -47,9 +47,18 @@ class MCMCSummary(object):
         # enforcing read-only or anything like that: so users will have the
         # ability to change the contents of ``chains``, and make it go out of
         # sync with the summary.
-        self._chains = chains
         self._chains_unmodified = chains
 
+        # Store chains as a single contiguous float array of shape
+        # ``(n_chains, n_samples, n_parameters)``. This only creates a copy if
+        # the chains were passed in as a list, or in a different layout.
+        chains = np.ascontiguousarray(chains, dtype=float)
+        if chains.ndim != 3:
+            raise ValueError(
+                'Chains must be given as a list of 2d arrays of equal shape,'
+                ' or as a 3d array.')
+        self._chains = chains
+
         # Deal with special case where only one chain is provided
         if len(chains) == 1:
             logging.basicConfig()
@@ -86,8 +95,9 @@ class MCMCSummary(object):
         self._quantiles = None
         self._rhat = None
         self._std = None
-        self._summary_list = []
+        self._summary_list = None
         self._summary_str = None
+        self._summary_table = None
 
         # Create summary
         self._make_summary()
@@ -108,7 +118,7 @@ class MCMCSummary(object):
                 headers.append('ess per sec.')
 
             self._summary_str = tabulate(
-                self._summary_list,
+                self._summary_rows(),
                 headers=headers,
                 numalign='left',
                 floatfmt='.2f',
@@ -142,43 +152,69 @@ class MCMCSummary(object):
         """
         Calculates posterior summaries for all parameters.
         """
-        stacked = np.vstack(self._chains)
-
-        # Mean, std and quantiles
-        self._mean = np.mean(stacked, axis=0)
-        self._std = np.std(stacked, axis=0)
+        # Gather means and squared deviations of the first and last half of
+        # each chain (as used by rhat), and of the middle sample if the chains
+        # have an odd length, in a single pass
+        n_chains, n, _ = self._chains.shape
+        h = n // 2
+        parts = []
+        if h > 0:
+            parts.append((h,) + _moments(self._chains[:, :h]))
+            parts.append((h,) + _moments(self._chains[:, n - h:]))
+        if n % 2:
+            parts.append((1,) + _moments(self._chains[:, h:h + 1]))
+
+        # Merge into per-chain and overall mean and std (Chan et al.), so that
+        # no stacked copy of the samples is needed
+        chain_means = sum(k * means for k, means, _ in parts) / n
+        chain_m2 = sum(
+            m2 + k * (means - chain_means)**2 for k, means, m2 in parts)
+        self._mean = np.mean(chain_means, axis=0)
+        m2 = np.sum(chain_m2 + n * (chain_means - self._mean)**2, axis=0)
+        self._std = np.sqrt(m2 / (n_chains * n))
+
+        # Quantiles, over all samples (reshaping the contiguous chains does
+        # not make a copy)
         self._quantiles = np.percentile(
-            stacked, [2.5, 25, 50, 75, 97.5], axis=0)
-
-        # Rhat
-        self._rhat = pints.rhat(self._chains)
+            self._chains.reshape((-1, self._n_parameters)),
+            [2.5, 25, 50, 75, 97.5], axis=0)
+
+        # Rhat, reusing the split chain moments
+        if h > 0:
+            self._rhat = pints.rhat(
+                self._chains,
+                means=np.concatenate((parts[0][1], parts[1][1])),
+                variances=np.concatenate((parts[0][2], parts[1][2])) / (h - 1),
+            )
+        else:
+            # Chains too short: let rhat raise an error
+            self._rhat = pints.rhat(self._chains)
 
-        # Effective sample size
+        # Effective sample size, reusing the chain means
         self._ess = np.zeros(self._n_parameters)
         for i, chain in enumerate(self._chains):
-            self._ess += pints.effective_sample_size(chain)
+            self._ess += pints.effective_sample_size(chain, chain_means[i])
 
         if self._time is not None:
             self._ess_per_second = np.array(self._ess) / self._time
 
-        # Create
-        for i in range(0, self._n_parameters):
-            row = [
-                self._parameter_names[i],
-                self._mean[i],
-                self._std[i],
-                self._quantiles[0, i],
-                self._quantiles[1, i],
-                self._quantiles[2, i],
-                self._quantiles[3, i],
-                self._quantiles[4, i],
-                self._rhat[i],
-                self._ess[i],
-            ]
-            if self._time is not None:
-                row.append(self._ess_per_second[i])
+        # Create numerical summary table, one row per parameter
+        columns = [self._mean, self._std, self._quantiles.T, self._rhat,
+                   self._ess]
+        if self._time is not None:
+            columns.append(self._ess_per_second)
+        self._summary_table = np.column_stack(columns)
 
-            self._summary_list.append(row)
+    def _summary_rows(self):
+        """
+        Returns (and caches) the summary table as a list of rows, each
+        starting with the parameter name.
+        """
+        if self._summary_list is None:
+            self._summary_list = [
+                [name] + row for name, row in
+                zip(self._parameter_names, self._summary_table.tolist())]
+        return self._summary_list
 
     def mean(self):
         """
@@ -212,10 +248,20 @@ class MCMCSummary(object):
         deviation, the 2.5%, 25%, 50%, 75% and 97.5% posterior quantiles,
         rhat, effective sample size (ess) and ess per second of run time.
         """
-        return list(self._summary_list)
+        return list(self._summary_rows())
 
     def time(self):
         """
         Return the run time taken for sampling.
         """
         return self._time
+
+
+def _moments(chains):
+    """
+    Returns the means and the sums of squared deviations from the mean of each
+    chain in a 3d array ``chains``, both as arrays of shape ``(m, p)``.
+    """
+    means = np.mean(chains, axis=1)
+    deviations = chains - means[:, np.newaxis]
+    return means, np.einsum('ijk,ijk->ik', deviations, deviations)
@@ -32,6 +32,22 @@ class TestDiagnostics(unittest.TestCase):
         for i in range(0, len(x)):
             self.assertAlmostEqual(y[i], y_true[i])
 
+        # Compare with a direct calculation on a longer series
+        np.random.seed(1)
+        x = np.cumsum(np.random.normal(size=1001))
+        z = (x - np.mean(x)) / (np.std(x) * np.sqrt(len(x)))
+        y_true = np.correlate(z, z, mode='full')[len(x) - 1:]
+        y = pints._diagnostics.autocorrelation(x)
+        self.assertTrue(np.allclose(y, y_true))
+
+        # Columns of a 2d array are treated independently
+        xs = np.array([x, x[::-1] ** 2]).T
+        ys = pints._diagnostics.autocorrelation(xs)
+        self.assertEqual(ys.shape, xs.shape)
+        self.assertTrue(np.allclose(ys[:, 0], y))
+        self.assertTrue(np.allclose(
+            ys[:, 1], pints._diagnostics.autocorrelation(xs[:, 1])))
+
     def test_autocorrelation_negative(self):
         # Tests autocorrelation_negative yields the correct result
         # under both possibilities
@@ -67,6 +83,11 @@ class TestDiagnostics(unittest.TestCase):
         self.assertAlmostEqual(y[0], 1.439232, 6)
         self.assertAlmostEqual(y[1], 1.315789, 6)
 
+        # with precomputed means
+        y = pints._diagnostics.effective_sample_size(x, np.mean(x, axis=0))
+        self.assertAlmostEqual(y[0], 1.439232, 6)
+        self.assertAlmostEqual(y[1], 1.315789, 6)
+
         # Bad calls
         self.assertRaisesRegex(
             ValueError, '2d array', pints.effective_sample_size, x[0])
@@ -123,6 +144,14 @@ class TestDiagnostics(unittest.TestCase):
         d = np.array(y) - np.array([0.84735944450487122, 1.1712652416950846])
         self.assertLess(np.linalg.norm(d), 0.01)
 
+        # Test Rhat computation from precomputed split chain moments
+        split = np.vstack([chains[:, :2], chains[:, 2:]])
+        means = np.mean(split, axis=1)
+        variances = np.var(split, axis=1, ddof=1)
+        y2 = pints._diagnostics.rhat(
+            chains, means=means, variances=variances)
+        self.assertTrue(np.allclose(y, y2))
+
     def test_bad_rhat_inputs(self):
         # Tests whether exceptions are thrown should the input to rhat not be
         # valid
@@ -73,6 +73,15 @@ class TestAdaptiveCovarianceMC(unittest.TestCase):
         self.assertRaises(ValueError, pints.MCMCSummary, self.chains, 0)
         self.assertRaises(ValueError, pints.MCMCSummary, self.chains, 1.5,
                           ["param 1"])
+        self.assertRaises(ValueError, pints.MCMCSummary, self.chains[0])
+
+    def test_list_of_chains(self):
+        # tests that chains can be passed in as a list of arrays
+        results1 = pints.MCMCSummary(self.chains)
+        results2 = pints.MCMCSummary(list(self.chains))
+        self.assertTrue(np.all(results1.mean() == results2.mean()))
+        self.assertTrue(np.all(results1.rhat() == results2.rhat()))
+        self.assertTrue(np.all(results1.ess() == results2.ess()))
 
     def test_running(self):
         # tests that object works as expected
@@ -97,6 +106,11 @@ class TestAdaptiveCovarianceMC(unittest.TestCase):
         self.assertTrue(np.abs(results.mean()[1] - 500) < 100)
         self.assertTrue(np.abs(results.mean()[2] - 10) < 20)
 
+        # check mean and std agree with a direct calculation
+        stacked = np.vstack(self.chains)
+        self.assertTrue(np.allclose(results.mean(), np.mean(stacked, axis=0)))
+        self.assertTrue(np.allclose(results.std(), np.std(stacked, axis=0)))
+
         # check quantiles object
         quantiles = results.quantiles()
         self.assertEqual(quantiles.shape[0], 5)
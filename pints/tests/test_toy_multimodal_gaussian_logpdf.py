@@ -32,8 +32,9 @@ class TestMultimodalGaussianLogPDF(unittest.TestCase):
         self.assertTrue(f3 < f1)
         f4 = f([0, -0.1])
         self.assertTrue(f4 < f1)
-        self.assertEqual(f([1e6, 1e6]), -float('inf'))
-        # Note: This is very basic testing, real tests are done in scipy!
+        # Far from the modes the log pdf should not underflow to -inf
+        self.assertAlmostEqual(
+            f([1e6, 1e6]) / (-np.log(2 * np.pi) - (1e6 - 10)**2), 1)
 
         # Single mode, 3d, standard covariance
         f = pints.toy.MultimodalGaussianLogPDF([[1, 1, 1]])
@@ -108,6 +109,34 @@ class TestMultimodalGaussianLogPDF(unittest.TestCase):
         self.assertAlmostEqual(dl[1], -0.054933536830093638)
         self.assertAlmostEqual(dl[2], -0.39317158556789844)
 
+    def test_sample(self):
+        # Tests that samples come from the right mode and covariance.
+
+        np.random.seed(1)
+        covariances = [[[4, 1.5], [1.5, 1]], [[1, -0.5], [-0.5, 2]]]
+        f = pints.toy.MultimodalGaussianLogPDF(
+            modes=[[0, 0], [20, 20]], covariances=covariances)
+        samples = f.sample(20000)
+        self.assertEqual(samples.shape, (20000, 2))
+        near = samples[:, 0] < 10
+        self.assertTrue(0.45 < np.mean(near) < 0.55)
+        for i, y in enumerate([samples[near], samples[~near]]):
+            self.assertTrue(np.allclose(
+                np.mean(y, axis=0), f._modes[i], atol=0.1))
+            self.assertTrue(np.allclose(
+                np.cov(y.T), covariances[i], atol=0.15))
+
+    def test_softmax(self):
+        # Tests the stable softmax used to weight the modes.
+
+        from pints.toy._multimodal_gaussian import _softmax
+        w, s = _softmax(np.array([-1000, -1000 - np.log(3)]))
+        self.assertTrue(np.allclose(w, [0.75, 0.25]))
+        self.assertAlmostEqual(s, -1000 + np.log(4 / 3))
+        w, s = _softmax(np.array([1000, 1000]))
+        self.assertTrue(np.allclose(w, [0.5, 0.5]))
+        self.assertAlmostEqual(s, 1000 + np.log(2))
+
     def test_suggested_bounds(self):
         # Tests suggested_bounds().
 
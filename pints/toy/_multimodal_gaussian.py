@@ -9,7 +9,7 @@ from __future__ import absolute_import, division
 from __future__ import print_function, unicode_literals
 import numpy as np
 import pints
-import scipy.stats
+import scipy.linalg
 
 from . import ToyLogPDF
 
@@ -78,19 +78,25 @@ class MultimodalGaussianLogPDF(ToyLogPDF):
                         'Covariance matrices must have shape (d, d), where d'
                         ' is the dimension of the given modes.')
 
-        # Create scipy 'random variables'
-        self._vars = [
-            scipy.stats.multivariate_normal(mode, self._covs[i])
-            for i, mode in enumerate(self._modes)]
+        # Store modes and covariances as (K, d) and (K, d, d) arrays
+        self._modes = np.array(self._modes, dtype=float)
+        self._covs = np.array(self._covs, dtype=float)
+
+        # Cholesky factors and log normalising constants for each mode
+        self._chols = np.linalg.cholesky(self._covs)
+        self._log_norms = (
+            -0.5 * self._n_parameters * np.log(2 * np.pi)
+            - np.sum(np.log(np.diagonal(self._chols, axis1=1, axis2=2)),
+                     axis=1))
 
         # See page 45 of
         # http://www.math.uwaterloo.ca/~hwolkowi//matrixcookbook.pdf
-        self._sigma_invs = [
-            np.linalg.inv(self._covs[i]) for i, mode in enumerate(self._modes)]
+        eye = np.eye(self._n_parameters)
+        self._sigma_invs = np.array([
+            scipy.linalg.cho_solve((chol, True), eye) for chol in self._chols])
 
     def __call__(self, x):
-        f = np.sum([var.pdf(x) for var in self._vars])
-        return -float('inf') if f == 0 else np.log(f)
+        return _softmax(self._log_pdfs(x))[1]
 
     def distance(self, samples):
         """
@@ -104,14 +110,12 @@ class MultimodalGaussianLogPDF(ToyLogPDF):
 
     def evaluateS1(self, x):
         """ See :meth:`LogPDF.evaluateS1()`. """
-        L = self.__call__(x)
-
-        denom = np.exp(L)
-        numer = np.sum([np.matmul(
-            self._sigma_invs[i], x - np.array(self._modes[i])
-        ) * var.pdf(x)
-            for i, var in enumerate(self._vars)], axis=0)
-        return L, -numer / denom
+        x = np.asarray(x, dtype=float)
+        # Gradient is the weighted sum of the gradients of each mode, with
+        # weights equal to that mode's share of the total density
+        w, L = _softmax(self._log_pdfs(x))
+        dL = -np.einsum('k,kij,kj->i', w, self._sigma_invs, x - self._modes)
+        return L, dL
 
     def kl_divergence(self, samples):
         """
@@ -134,45 +138,45 @@ class MultimodalGaussianLogPDF(ToyLogPDF):
             raise ValueError(
                 'Given samples must have length ' + str(self._n_parameters))
 
-        best_mode = np.zeros(samples.shape[0])
-        for i in range(samples.shape[0]):
-            a_sample = samples[i, :]
-            a_log_pdf = -float('Inf')
-            a_max_index = -1
-            for j, var in enumerate(self._vars):
-                a_test_log_pdf = var.logpdf(a_sample)
-                if a_test_log_pdf > a_log_pdf:
-                    a_log_pdf = a_test_log_pdf
-                    a_max_index = j
-            best_mode[i] = a_max_index
-
-        kl = np.zeros(len(self._vars))
-        for i in range(len(self._vars)):
+        best_mode = np.argmax(self._log_pdfs(samples), axis=1)
+
+        kl = np.zeros(len(self._modes))
+        for i in range(len(self._modes)):
             y = np.array(samples[best_mode == i, :], copy=True)
             # when a mode has no points use all samples
             if y.shape[0] == 0:
                 y = np.array(samples, copy=True)
             m0 = np.mean(y, axis=0)
-            s0 = np.cov(y.T)
-            s1 = self._covs[i]
+            s0 = np.atleast_2d(np.cov(y.T))
             m1 = self._modes[i]
-            s1_inv = np.linalg.inv(s1)
-            if len(np.atleast_1d(s0)) > 1:
-                kl[i] = 0.5 * (
-                    np.trace(np.matmul(s1_inv, s0)) +
-                    np.matmul(np.matmul(m1 - m0, s1_inv), m1 - m0) -
-                    np.log(np.linalg.det(s0)) +
-                    np.log(np.linalg.det(s1)) -
-                    self._n_parameters)
-            else:
-                kl[i] = 0.5 * (
-                    np.sum(s1_inv * s0) +
-                    (m1 - m0) * s1_inv * (m1 - m0) -
-                    np.log(s0) +
-                    np.log(s1) -
-                    1)
+            chol = self._chols[i]
+
+            # Use the Cholesky factor of s1 for all solves and determinants
+            dm = scipy.linalg.solve_triangular(chol, m1 - m0, lower=True)
+            kl[i] = 0.5 * (
+                np.trace(scipy.linalg.cho_solve((chol, True), s0)) +
+                np.dot(dm, dm) -
+                np.linalg.slogdet(s0)[1] +
+                2 * np.sum(np.log(np.diag(chol))) -
+                self._n_parameters)
         return kl
 
+    def _log_pdfs(self, x):
+        """
+        Returns the (normalised) log pdf of each mode at ``x``.
+
+        If ``x`` is a single point the result has shape ``(K, )``, where ``K``
+        is the number of modes. If ``x`` has shape ``(n, d)`` the result has
+        shape ``(n, K)``.
+        """
+        diffs = np.asarray(x, dtype=float)[..., np.newaxis, :] - self._modes
+        log_pdfs = np.empty(diffs.shape[:-1])
+        for i, chol in enumerate(self._chols):
+            y = scipy.linalg.solve_triangular(
+                chol, diffs[..., i, :].T, lower=True)
+            log_pdfs[..., i] = self._log_norms[i] - 0.5 * np.sum(y**2, axis=0)
+        return log_pdfs
+
     def n_parameters(self):
         """ See :meth:`pints.LogPDF.n_parameters()`. """
         return self._n_parameters
@@ -184,12 +188,14 @@ class MultimodalGaussianLogPDF(ToyLogPDF):
             raise ValueError(
                 'Number of samples must be greater than or equal to 1.')
 
-        samples = np.zeros((n_samples, self._n_parameters))
-        num_modes = len(self._modes)
-        for i in range(n_samples):
-            rand_mode = np.random.choice(num_modes, 1)[0]
-            samples[i, :] = self._vars[rand_mode].rvs(1)
-        return samples
+        # Choose a mode for every sample, then transform standard normal
+        # draws with that mode's Cholesky factor
+        modes = np.random.choice(len(self._modes), n_samples)
+        z = np.random.standard_normal((n_samples, self._n_parameters))
+        for i, chol in enumerate(self._chols):
+            selected = modes == i
+            z[selected] = np.dot(z[selected], chol.T)
+        return self._modes[modes] + z
 
     def suggested_bounds(self):
         """ See :meth:`pints.toy.ToyLogPDF.suggested_bounds()`. """
@@ -202,3 +208,15 @@ class MultimodalGaussianLogPDF(ToyLogPDF):
         bounds = np.tile([lower, upper], (self._n_parameters, 1))
         return np.transpose(bounds).tolist()
 
+
+def _softmax(log_p):
+    """
+    Returns the normalised weights ``exp(log_p) / sum(exp(log_p))`` and the
+    log of the normalising constant, ``log(sum(exp(log_p)))``, shifting by the
+    maximum of ``log_p`` to avoid under- and overflow.
+    """
+    m = np.max(log_p)
+    w = np.exp(log_p - m)
+    s = np.sum(w)
+    w /= s
+    return w, m + np.log(s)
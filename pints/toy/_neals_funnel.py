@@ -52,11 +52,19 @@ class NealsFunnelLogPDF(ToyLogPDF):
         if len(x) != self._n_parameters:
             raise ValueError(
                 'Length of x must be equal number of parameters')
+        x = np.asarray(x, dtype=float)
         nu = x[-1]
         x_temp = x[:-1]
-        x_log_pdf = [scipy.stats.norm.logpdf(y, 0, np.exp(nu / 2))
-                     for y in x_temp]
-        return np.sum(x_log_pdf) + scipy.stats.norm.logpdf(nu, 0, 3)
+        n = len(x_temp)
+
+        # Sum of the Gaussian log pdfs of x_i, with variance exp(nu), and of
+        # nu, with variance 9, written out in closed form
+        return (
+            -0.5 * n * (np.log(2 * np.pi) + nu)
+            - 0.5 * np.exp(-nu) * np.dot(x_temp, x_temp)
+            - 0.5 * np.log(2 * np.pi * self._s1)
+            - 0.5 * self._s1_inv * nu**2
+        )
 
     def distance(self, samples):
         """ See :meth:`pints.toy.ToyLogPDF.distance()`. """
@@ -64,15 +72,15 @@ class NealsFunnelLogPDF(ToyLogPDF):
 
     def evaluateS1(self, x):
         """ See :meth:`LogPDF.evaluateS1()`. """
+        x = np.asarray(x, dtype=float)
         L = self.__call__(x)
 
         nu = x[-1]
         x_temp = x[:-1]
         cons = np.exp(-nu)
-        dnu_first = [0.5 * (cons * var**2 - 1) for var in x_temp]
-        dnu = np.sum(dnu_first) - nu / 9.0
-        dL = [-var * cons for var in x_temp]
-        dL.append(dnu)
+        dL = np.empty(self._n_parameters)
+        dL[:-1] = -x_temp * cons
+        dL[-1] = np.sum(0.5 * (cons * x_temp**2 - 1)) - nu / 9.0
         return L, dL
 
     def kl_divergence(self, samples):
@@ -118,13 +126,12 @@ class NealsFunnelLogPDF(ToyLogPDF):
     def sample(self, n_samples):
         """ See :meth:`pints.toy.ToyLogPDF.sample()`. """
         n = self._n_parameters
-        samples = np.zeros((n_samples, n))
-        for i in range(n_samples):
-            nu = np.random.normal(0, 3, 1)[0]
-            sd = np.exp(nu / 2)
-            x = np.random.normal(0, sd, n - 1)
-            samples[i, 0:(n - 1)] = x
-            samples[i, n - 1] = nu
+        samples = np.empty((n_samples, n))
+        nu = np.random.normal(0, 3, n_samples)
+        sd = np.exp(nu / 2)
+        samples[:, :-1] = (
+            np.random.standard_normal((n_samples, n - 1)) * sd[:, np.newaxis])
+        samples[:, -1] = nu
         return samples
 
     def suggested_bounds(self):